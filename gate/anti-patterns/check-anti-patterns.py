@@ -167,7 +167,7 @@ def load_rules(path: Path) -> dict[str, object]:
     data = parse_toml(path.read_text(encoding="utf-8"))
     cfg = data.get("complexity_guardrails")
     if not isinstance(cfg, dict):
-        raise ValueError("missing [complexity_guardrails] table")
+        raise ValueError("missing [complexity_guardrails] table")  # noqa: TRY004 - invalid rules data, not a type bug
     required_terms = cfg.get("required_terms")
     if not isinstance(required_terms, dict) or not required_terms:
         raise ValueError("missing [complexity_guardrails.required_terms]")
@@ -3,38 +3,106 @@
 
 from __future__ import annotations
 
-import argparse
-import json
+import functools
+import os
 import re
-import shutil
-import subprocess
 import sys
+from bisect import bisect_right
+from collections import deque
+from collections.abc import Iterator
+from itertools import chain
 from pathlib import Path
-from typing import Any
+from types import SimpleNamespace
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    import argparse
 
 try:
     import tomllib
 except ModuleNotFoundError:
     tomllib = None  # type: ignore[assignment]
 
+try:
+    import ahocorasick  # type: ignore[import-not-found]
+except ModuleNotFoundError:
+    ahocorasick = None  # type: ignore[assignment]
+
 NAME_RE = re.compile(r"^[a-z0-9](?:[a-z0-9-]{0,62}[a-z0-9])?$")
+_NON_ALNUM_RE = re.compile(r"[^a-z0-9]+")
+_NORMALIZE_TABLE = str.maketrans(
+    {chr(cp): "-" for cp in range(128) if not ("a" <= chr(cp) <= "z" or "0" <= chr(cp) <= "9")}
+)
+_DASHES_RE = re.compile(r"-{2,}")
+_BAGAKIT_REF_RE = re.compile(r"\bbagakit-[a-z0-9-]+\b")
+_SKILLS_PATH_RE = re.compile(r"/skills/([a-z0-9-]+)")
+_RUNNER_RE = re.compile(r"\b(bash|sh|python3?|node)\b")
+_TRIGGER_RE = re.compile(r"\bwhen\b|适用|当|用于")
+_NON_BLANK_LINE_RE = re.compile(r"(?m)^[ \t]*\S")
+_FRONTMATTER_LINE_RE = re.compile(r"^\s*([A-Za-z_][\w-]*)\s*:\s*['\"]?(.*?)['\"]?\s*$", re.MULTILINE)
+# One fused pass over SKILL.md records which document-level checks fired,
+# instead of a separate substring/regex scan per check. The peer alternative
+# keeps its bullet lines in a lookahead so they stay visible to other groups.
+_FUSED_DOC_RE = re.compile(
+    r"(?P<standalone>(?i:standalone))"
+    r"|(?P<optional>(?i:optional))"
+    r"|(?P<contract>(?i:contract|schema|signal|契约|信号))"
+    r"|(?P<workflow>## Workflow)"
+    r"|(?P<bagakit_peer>^\[\[BAGAKIT\]\](?=\s*\n(?:- .+\n)+))"
+    r"|(?P<bagakit_anchor>^\[\[BAGAKIT\]\]\s*$)"
+    r"|(?P<bagakit_call>bash \.bagakit/)",
+    re.MULTILINE,
+)
+# Advisory literals surfaced by the fused scan; adding a check means adding a
+# named group above and its message here, not another pass over the document.
+_DOC_FLAG_WARNINGS = {
+    "bagakit_call": (
+        "SKILL.md contains direct '.bagakit' script call; ensure this is optional and not a hard dependency"
+    ),
+}
+_BULLET_RE = re.compile(r"(?m)^\s*[-*]\s+\S")
+_HEADING_WHEN_TO_USE_RE = re.compile(r"^##\s+When to Use(?: This Skill)?\s*$", re.IGNORECASE)
+_HEADING_WHEN_NOT_TO_USE_RE = re.compile(r"^##\s+When NOT to Use(?: This Skill)?\s*$", re.IGNORECASE)
+_HEADING_FALLBACK_RE = re.compile(
+    r"^##\s+(?:Fallback Path(?:\s*\(.*\))?|When No Clear Fit(?:\s*\(.*\))?)\s*$", re.IGNORECASE
+)
+_HEADING_OUTPUT_RE = re.compile(
+    r"^##\s+(?:Output Routes(?: and Default Mode)?|Output Contract|Output System Contract)\s*$", re.IGNORECASE
+)
+_HEADING_ARCHIVE_RE = re.compile(
+    r"^##\s+(?:Archive Gate(?:\s*\(.*\))?|Completion Handoff(?: and Archive)?|Archive(?: and Handoff)?)\s*$",
+    re.IGNORECASE,
+)
+_REQUIRED_BULLET_SECTIONS: tuple[tuple[re.Pattern[str], int, str], ...] = (
+    (_HEADING_WHEN_TO_USE_RE, 2, "SKILL.md must include '## When to Use' section with at least 2 bullet items"),
+    (_HEADING_WHEN_NOT_TO_USE_RE, 2, "SKILL.md must include '## When NOT to Use' section with at least 2 bullet items"),
+    (_HEADING_FALLBACK_RE, 1, "SKILL.md must include a fallback section with at least 1 bullet action"),
+    (_HEADING_OUTPUT_RE, 2, "SKILL.md must include output routes/default section with at least 2 bullet items"),
+    (_HEADING_ARCHIVE_RE, 1, "SKILL.md must include archive gate/hand-off section with at least 1 bullet action"),
+)
 PLACEHOLDER_HINTS = ("TODO", "[TODO", "replace")
 MAX_SKILL_LINES = 500
 FILE_STEM_RE = re.compile(r"^[a-z0-9][a-z0-9_-]*$")
-GENERIC_FILE_STEMS = {"helper", "helpers", "misc", "tmp", "temp", "util", "utils", "test", "tests"}
-LEGACY_TERMS = {"legacy", "compat", "deprecated", "workaround", "shim", "backward", "old"}
-LEGACY_TERM_ALLOWLIST_STEMS = {"migration-from-old-version", "migration-from-previous-version"}
-OPTIONAL_HINTS = (
-    "optional",
-    "if available",
-    "if installed",
-    "contract",
-    "schema",
-    "signal",
-    "可选",
-    "契约",
-    "信号",
+GENERIC_FILE_STEMS = frozenset({"helper", "helpers", "misc", "tmp", "temp", "util", "utils", "test", "tests"})
+LEGACY_TERMS = frozenset({"legacy", "compat", "deprecated", "workaround", "shim", "backward", "old"})
+LEGACY_TERM_ALLOWLIST_STEMS = frozenset({"migration-from-old-version", "migration-from-previous-version"})
+OPTIONAL_HINTS = frozenset(
+    {
+        "optional",
+        "if available",
+        "if installed",
+        "contract",
+        "schema",
+        "signal",
+        "可选",
+        "契约",
+        "信号",
+    }
 )
+# Single-pass alternations: one compiled scan instead of one substring search
+# per hint for every line/description examined.
+_OPTIONAL_HINTS_RE = re.compile("|".join(re.escape(hint) for hint in sorted(OPTIONAL_HINTS)))
+_PLACEHOLDER_HINTS_RE = re.compile("|".join(re.escape(hint) for hint in PLACEHOLDER_HINTS))
 COUPLING_HINTS = (
     "must",
     "require",
@@ -51,6 +119,16 @@ COUPLING_HINTS = (
     "python",
     "node",
 )
+# Optional fast path: one Aho-Corasick walk classifies coupling and optional
+# hints per line; without pyahocorasick the compiled alternations are used.
+if ahocorasick is not None:
+    _HINT_AUTOMATON = ahocorasick.Automaton()
+    for _kind, _hints in (("coupling", COUPLING_HINTS), ("optional", OPTIONAL_HINTS)):
+        for _hint in _hints:
+            _HINT_AUTOMATON.add_word(_hint, (_kind, _hint))
+    _HINT_AUTOMATON.make_automaton()
+else:
+    _HINT_AUTOMATON = None
 NON_SKILL_BAGAKIT_TOKENS = {
     "bagakit-series",
     "bagakit-profile",
@@ -104,15 +182,41 @@ NO_ADAPTER_HINTS = (
     "无联动",
     "仅本地",
 )
-ALLOWED_SCRIPT_EXTENSIONS = {".sh", ".py", ".js", ".ts"}
-ALLOWED_REFERENCE_EXTENSIONS = {".md", ".txt", ".json", ".yaml", ".yml"}
+
+# Compiled alternations over the hint tuples above: each presence check
+# becomes one C-level scan instead of a Python loop of substring searches.
+def _hints_re(hints: tuple[str, ...]) -> re.Pattern[str]:
+    return re.compile("|".join(re.escape(hint) for hint in hints))
+
+
+_COUPLING_HINTS_RE = _hints_re(COUPLING_HINTS)
+_ACTION_HINTS_RE = _hints_re(ACTION_HINTS)
+_MEMORY_HINTS_RE = _hints_re(MEMORY_HINTS)
+_ARCHIVE_HINTS_RE = _hints_re(ARCHIVE_HINTS)
+_ADAPTER_HINTS_RE = _hints_re(ADAPTER_HINTS)
+_GENERIC_ADAPTER_HINTS_RE = _hints_re(GENERIC_ADAPTER_HINTS)
+_CONCRETE_ADAPTER_HINTS_RE = _hints_re(CONCRETE_ADAPTER_HINTS)
+_NO_ADAPTER_HINTS_RE = _hints_re(NO_ADAPTER_HINTS)
+ALLOWED_SCRIPT_EXTENSIONS = frozenset({".sh", ".py", ".js", ".ts"})
+ALLOWED_REFERENCE_EXTENSIONS = frozenset({".md", ".txt", ".json", ".yaml", ".yml"})
 ALLOWED_GATE_EXTENSIONS = ALLOWED_SCRIPT_EXTENSIONS | {".md", ".txt", ".json", ".yaml", ".yml", ".toml"}
-ABSOLUTE_PATH_SCAN_EXTENSIONS = {".md", ".txt", ".json", ".yaml", ".yml", ".toml"} | ALLOWED_SCRIPT_EXTENSIONS
+ABSOLUTE_PATH_SCAN_EXTENSIONS = frozenset({".md", ".txt", ".json", ".yaml", ".yml", ".toml"}) | ALLOWED_SCRIPT_EXTENSIONS
 ABSOLUTE_POSIX_RE = re.compile(
     r"(?<![:A-Za-z0-9_])/(?:Users|home|private|var|tmp|opt|usr|etc|mnt|Volumes|absolute)(?:/[^\s\"'`<>|]+)+"
 )
 ABSOLUTE_WINDOWS_RE = re.compile(r"(?i)\b[A-Z]:[\\/][^\s\"'`<>|]+")
+# Both patterns fused so each scanned file takes one pass; the Windows arm
+# keeps its case-insensitivity via a scoped inline flag.
+_ABSOLUTE_PATH_ANY_RE = re.compile(
+    f"(?:{ABSOLUTE_POSIX_RE.pattern})|(?i:{ABSOLUTE_WINDOWS_RE.pattern.removeprefix('(?i)')})"
+)
+_NEWLINE_RE = re.compile(r"\n")
+# Bytes twins of the scanner patterns: matching raw bytes skips the UTF-8
+# decode of every scanned file (the patterns are pure ASCII).
+_ABSOLUTE_PATH_ANY_B_RE = re.compile(_ABSOLUTE_PATH_ANY_RE.pattern.encode("ascii"))
+_NEWLINE_B_RE = re.compile(rb"\n")
 ABSOLUTE_PATH_ALLOWED_PREFIXES = ("/usr/bin/env",)
+_ABSOLUTE_PATH_ALLOWED_PREFIXES_B = tuple(prefix.encode("ascii") for prefix in ABSOLUTE_PATH_ALLOWED_PREFIXES)
 SCRIPT_RESOLUTION_FALLBACK_PATTERNS = (
     re.compile(r"(?i)(?:\$HOME|~)/\.bagakit/skills/[a-z0-9-]+"),
     re.compile(r"\$\{BAGAKIT_HOME:-\$HOME/\.bagakit\}/skills/[a-z0-9-]+"),
@@ -134,12 +238,22 @@ SCRIPT_TEMPLATE_SUFFIXES = (
 )
 DISCOURAGED_ADAPTER_KEYS = ("driver_ftharness", "driver_openspec", "driver_longrun")
 ANTI_PATTERN_HINTS = ("avoid", "bad pattern", "anti-pattern", "instead of", "不要", "避免", "禁用")
+_ANTI_PATTERN_HINTS_RE = _hints_re(ANTI_PATTERN_HINTS)
+_DISCOURAGED_ADAPTER_KEYS_RE = _hints_re(DISCOURAGED_ADAPTER_KEYS)
 PLAYBOOK_DIR_CANONICAL = "playbook"
 PLAYBOOK_DIR_LEGACY = "reference"
 PLAYBOOK_DIR_OLDER = "references"
 PLAYBOOK_DIR_ALIASES = (PLAYBOOK_DIR_CANONICAL, PLAYBOOK_DIR_LEGACY, PLAYBOOK_DIR_OLDER)
 DOCS_DIR = "docs"
 GATE_DIR = "gate"
+_RUNTIME_DIR_EXT: dict[str, frozenset[str]] = {
+    "scripts": ALLOWED_SCRIPT_EXTENSIONS,
+    GATE_DIR: ALLOWED_GATE_EXTENSIONS,
+    PLAYBOOK_DIR_CANONICAL: ALLOWED_REFERENCE_EXTENSIONS,
+    PLAYBOOK_DIR_LEGACY: ALLOWED_REFERENCE_EXTENSIONS,
+    PLAYBOOK_DIR_OLDER: ALLOWED_REFERENCE_EXTENSIONS,
+    DOCS_DIR: ALLOWED_REFERENCE_EXTENSIONS,
+}
 ANTI_PATTERNS_GATE_CASE = "anti-patterns"
 ANTI_PATTERNS_GATE_RULES = "rules.toml"
 ANTI_PATTERNS_GATE_CHECK_PREFIX = "check-"
@@ -357,9 +471,29 @@ def eprint(*items: object) -> None:
     print(*items, file=sys.stderr)
 
 
+def print_warnings(warnings: list[str]) -> None:
+    """Emit all warnings through one stdout write instead of one per line."""
+    if warnings:
+        sys.stdout.write("warn: " + "\nwarn: ".join(warnings) + "\n")
+
+
+def eprint_errors(errors: list[str]) -> None:
+    """Emit all errors through one stderr write instead of one per line."""
+    if errors:
+        sys.stderr.write("error: " + "\nerror: ".join(errors) + "\n")
+
+
 def normalize_name(raw: str) -> str:
-    name = re.sub(r"[^a-z0-9]+", "-", raw.strip().lower())
-    name = re.sub(r"-{2,}", "-", name).strip("-")
+    lowered = raw.strip().lower()
+    if lowered.isascii():
+        # Table lookup per character; the regex stays as the non-ASCII fallback.
+        name = lowered.translate(_NORMALIZE_TABLE)
+        if "--" in name:
+            name = _DASHES_RE.sub("-", name)
+    else:
+        # The + quantifier already collapses runs, so no second pass is needed.
+        name = _NON_ALNUM_RE.sub("-", lowered)
+    name = name.strip("-")
     if not name:
         raise SystemExit("error: normalized skill name is empty")
     if not NAME_RE.match(name):
@@ -369,18 +503,23 @@ def normalize_name(raw: str) -> str:
     return name
 
 
+@functools.cache
 def title_case(name: str) -> str:
     return " ".join(part.capitalize() for part in name.split("-"))
 
 
 def write_text(path: Path, content: str) -> None:
-    path.parent.mkdir(parents=True, exist_ok=True)
-    path.write_text(content, encoding="utf-8")
+    # cmd_init pre-creates every target directory; encode once and push the
+    # bytes through a single fd-level write, skipping the Path/file-object
+    # layers and the redundant per-file mkdir.
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        os.write(fd, content.encode("utf-8"))
+    finally:
+        os.close(fd)
 
 
-def build_skill_md(name: str) -> str:
-    title = title_case(name)
-    return f"""---
+_SKILL_MD_TEMPLATE = """---
 name: {name}
 description: TODO: describe what this skill does and exactly when to use it.
 ---
@@ -583,6 +722,32 @@ Next: complete task directly and collect examples for future skill design.
 """
 
 
+@functools.cache
+def build_skill_md(name: str) -> str:
+    return _SKILL_MD_TEMPLATE.format_map({"name": name, "title": title_case(name)})
+
+
+# Static template text pre-encoded once at import; init stitches the name and
+# title bytes between the frozen segments with one writev.
+_SKILL_MD_SLOT_RE = re.compile(r"\{name\}|\{title\}")
+_SKILL_MD_SEGMENTS = tuple(part.encode("utf-8") for part in _SKILL_MD_SLOT_RE.split(_SKILL_MD_TEMPLATE))
+_SKILL_MD_SLOTS = tuple(match.group(0) for match in _SKILL_MD_SLOT_RE.finditer(_SKILL_MD_TEMPLATE))
+
+
+def write_skill_md(path: Path, name: str) -> None:
+    fills = {"{name}": name.encode("utf-8"), "{title}": title_case(name).encode("utf-8")}
+    buffers = [_SKILL_MD_SEGMENTS[0]]
+    for slot, segment in zip(_SKILL_MD_SLOTS, _SKILL_MD_SEGMENTS[1:]):
+        buffers.append(fills[slot])
+        buffers.append(segment)
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        os.writev(fd, buffers)
+    finally:
+        os.close(fd)
+
+
+@functools.cache
 def build_openai_yaml(name: str) -> str:
     display = title_case(name)
     return (
@@ -896,7 +1061,7 @@ def load_rules(path: Path) -> dict[str, object]:
     data = parse_toml(path.read_text(encoding="utf-8"))
     cfg = data.get("complexity_guardrails")
     if not isinstance(cfg, dict):
-        raise ValueError("missing [complexity_guardrails] table")
+        raise ValueError("missing [complexity_guardrails] table")  # noqa: TRY004 - invalid rules data, not a type bug
     required_terms = cfg.get("required_terms")
     if not isinstance(required_terms, dict) or not required_terms:
         raise ValueError("missing [complexity_guardrails.required_terms]")
@@ -987,6 +1152,8 @@ Use `gate/` as the validation protocol root.
 
 
 def cmd_init(args: argparse.Namespace) -> int:
+    import json
+
     name = normalize_name(args.name)
     root = Path(args.path).expanduser().resolve()
     skill_dir = root / name
@@ -1003,12 +1170,13 @@ def cmd_init(args: argparse.Namespace) -> int:
     (skill_dir / DOCS_DIR / DISCOVERY_DIR_NAME).mkdir(parents=True, exist_ok=True)
     (skill_dir / "scripts").mkdir(parents=True, exist_ok=True)
     (skill_dir / GATE_DIR / ANTI_PATTERNS_GATE_CASE).mkdir(parents=True, exist_ok=True)
+    if args.with_agents:
+        (skill_dir / "agents").mkdir(parents=True, exist_ok=True)
 
-    write_text(skill_dir / "SKILL.md", build_skill_md(name))
-    write_text(
-        skill_dir / "SKILL_PAYLOAD.json",
-        json.dumps({"version": 1, "include": includes}, indent=2, ensure_ascii=False) + "\n",
-    )
+    write_skill_md(skill_dir / "SKILL.md", name)
+    with open(skill_dir / "SKILL_PAYLOAD.json", "w", encoding="utf-8", newline="\n") as payload_fh:
+        json.dump({"version": 1, "include": includes}, payload_fh, indent=2, ensure_ascii=False)
+        payload_fh.write("\n")
     write_text(
         skill_dir / PLAYBOOK_DIR_CANONICAL / "start-here.md",
         "# Start Here\n\nAdd playbook details that are too detailed for SKILL.md.\n",
@@ -1053,31 +1221,49 @@ def cmd_init(args: argparse.Namespace) -> int:
 
 
 def parse_frontmatter(text: str) -> tuple[dict[str, str], list[str]]:
-    lines = text.splitlines()
-    if len(lines) < 3 or lines[0].strip() != "---":
+    newline = text.find("\n")
+    if newline == -1 or text[:newline].strip() != "---":
         return {}, ["SKILL.md must start with YAML frontmatter ('---'); TOML frontmatter guidance applies to artifact metadata blocks"]
-    try:
-        end = lines.index("---", 1)
-    except ValueError:
+    start = newline + 1
+
+    # Probe for the closing delimiter instead of materializing every line of
+    # the document; only the frontmatter slab gets split below.  Starting one
+    # char back catches a close on the very next line (empty frontmatter).
+    end_idx = -1
+    search = start - 1
+    while True:
+        idx = text.find("\n---", search)
+        if idx == -1:
+            break
+        after = idx + 4
+        if after >= len(text) or text[after] in "\r\n":
+            end_idx = idx
+            break
+        search = idx + 1
+    if end_idx == -1:
         return {}, ["SKILL.md frontmatter is not closed with '---'"]
 
-    kv: dict[str, str] = {}
+    body = text[start:end_idx]
+    kv = {match.group(1): match.group(2) for match in _FRONTMATTER_LINE_RE.finditer(body)}
     errors: list[str] = []
-    for raw in lines[1:end]:
-        line = raw.strip()
-        if not line:
-            continue
-        if ":" not in line:
-            errors.append(f"invalid frontmatter line: {raw}")
-            continue
-        key, value = line.split(":", 1)
-        kv[key.strip()] = value.strip().strip('"').strip("'")
+    # Only fall back to a per-line diff when something did not match; the
+    # happy path counts non-blank lines in place instead of splitting them.
+    if len(kv) != sum(1 for _ in _NON_BLANK_LINE_RE.finditer(body)):
+        errors.extend(
+            f"invalid frontmatter line: {raw}"
+            for raw in body.splitlines()
+            if raw.strip() and not _FRONTMATTER_LINE_RE.match(raw)
+        )
     return kv, errors
 
 
 def load_payload(path: Path) -> tuple[dict[str, Any] | None, list[str]]:
+    # Deferred import: commands that never touch the payload skip the json
+    # module cost, and loads() decodes the raw bytes in C.
+    import json
+
     try:
-        data = json.loads(path.read_text(encoding="utf-8"))
+        data = json.loads(path.read_bytes())
     except FileNotFoundError:
         return None, [f"missing file: {path}"]
     except json.JSONDecodeError as exc:
@@ -1219,32 +1405,59 @@ def load_complexity_gate_rules(skill_dir: Path) -> tuple[dict[str, Any], list[st
 
 
 def line_is_optional_contract(line: str) -> bool:
-    lower = line.lower()
-    return any(hint in lower for hint in OPTIONAL_HINTS)
+    return bool(_OPTIONAL_HINTS_RE.search(line.lower()))
+
+
+_SECTION_HEADING_LINE_RE = re.compile(r"(?m)^##\s+.*$")
+
 
+def index_sections(skill_text: str) -> list[tuple[str, int, int]]:
+    """Locate every '## ' section in one pass: (heading line, body start, body end)."""
+    matches = list(_SECTION_HEADING_LINE_RE.finditer(skill_text))
+    sections: list[tuple[str, int, int]] = []
+    for pos, match in enumerate(matches):
+        end = matches[pos + 1].start() if pos + 1 < len(matches) else len(skill_text)
+        sections.append((match.group(0), match.end(), end))
+    return sections
 
-def section_has_bullets(skill_text: str, heading_re: str, min_count: int = 1) -> bool:
-    block = section_block(skill_text, heading_re)
+
+def section_has_bullets(
+    skill_text: str,
+    heading_re: str | re.Pattern[str],
+    min_count: int = 1,
+    sections: list[tuple[str, int, int]] | None = None,
+) -> bool:
+    block = section_block(skill_text, heading_re, sections)
     if block is None:
         return False
-    bullets = re.findall(r"(?m)^\s*[-*]\s+\S", block)
-    return len(bullets) >= min_count
+    return len(_BULLET_RE.findall(block)) >= min_count
 
 
-def section_block(skill_text: str, heading_re: str) -> str | None:
-    match = re.search(heading_re, skill_text, flags=re.IGNORECASE | re.MULTILINE)
-    if not match:
-        return None
-    tail = skill_text[match.end() :]
-    next_heading = re.search(r"(?m)^##\s+", tail)
-    return tail[: next_heading.start()] if next_heading else tail
+def section_block(
+    skill_text: str,
+    heading_re: str | re.Pattern[str],
+    sections: list[tuple[str, int, int]] | None = None,
+) -> str | None:
+    if sections is None:
+        sections = index_sections(skill_text)
+    pattern = heading_re if isinstance(heading_re, re.Pattern) else re.compile(heading_re, flags=re.IGNORECASE)
+    for heading, start, end in sections:
+        if pattern.match(heading):
+            return skill_text[start:end]
+    return None
 
 
-def detect_playbook_layout(skill_dir: Path) -> tuple[bool, bool, bool]:
-    has_canonical = (skill_dir / PLAYBOOK_DIR_CANONICAL).exists()
-    has_legacy = (skill_dir / PLAYBOOK_DIR_LEGACY).exists()
-    has_older = (skill_dir / PLAYBOOK_DIR_OLDER).exists()
-    return has_canonical, has_legacy, has_older
+def detect_playbook_layout(skill_dir: Path, entries: set[str] | None = None) -> tuple[bool, bool, bool]:
+    if entries is None:
+        try:
+            entries = {entry.name for entry in os.scandir(skill_dir)}
+        except OSError:
+            entries = set()
+    return (
+        PLAYBOOK_DIR_CANONICAL in entries,
+        PLAYBOOK_DIR_LEGACY in entries,
+        PLAYBOOK_DIR_OLDER in entries,
+    )
 
 
 def scan_discovery_evidence(skill_dir: Path, *, strict_authority: bool = False) -> tuple[list[str], list[str]]:
@@ -1383,6 +1596,9 @@ def scan_discovery_evidence(skill_dir: Path, *, strict_authority: bool = False)
     return errors, warnings
 
 
+_VALIDATION_SCRIPT_STEM_RE = re.compile(r"^(?:check|validate|audit|lint|gate)(?:[-_].*)?$")
+
+
 def scan_gate_layout(skill_dir: Path) -> tuple[list[str], list[str]]:
     errors: list[str] = []
     warnings: list[str] = []
@@ -1425,58 +1641,111 @@ def scan_gate_layout(skill_dir: Path) -> tuple[list[str], list[str]]:
 
     scripts_root = skill_dir / "scripts"
     if scripts_root.is_dir():
-        for path in sorted(scripts_root.rglob("*")):
-            if not path.is_file():
-                continue
-            stem = path.stem.lower()
-            if re.match(r"^(?:check|validate|audit|lint|gate)(?:[-_].*)?$", stem):
-                rel = path.relative_to(skill_dir).as_posix()
-                warnings.append(f"validation-like script detected outside gate/: {rel}; prefer {GATE_DIR}/<case>/")
+        rel_start = len(str(skill_dir)) + 1
+        hits: list[str] = []
+        for name, fspath in _iter_files(scripts_root):
+            dot = name.rfind(".")
+            stem = (name[:dot] if dot > 0 else name).lower()
+            if _VALIDATION_SCRIPT_STEM_RE.match(stem):
+                hits.append(fspath[rel_start:])
+        hits.sort()
+        warnings.extend(
+            f"validation-like script detected outside gate/: {rel}; prefer {GATE_DIR}/<case>/" for rel in hits
+        )
 
     return errors, warnings
 
 
-def scan_hard_coupling(skill_text: str, own_name: str) -> list[str]:
-    errors: list[str] = []
-    for idx, line in enumerate(skill_text.splitlines(), 1):
-        lower = line.lower()
-        for token in re.findall(r"\bbagakit-[a-z0-9-]+\b", lower):
+def _line_hint_kinds(lower: str) -> tuple[bool, bool]:
+    """Return (has coupling hint, has optional-contract hint) for one lowered line."""
+    if _HINT_AUTOMATON is not None:
+        has_coupling = False
+        has_optional = False
+        for _, (kind, _hint) in _HINT_AUTOMATON.iter(lower):
+            if kind == "coupling":
+                has_coupling = True
+            else:
+                has_optional = True
+            if has_coupling and has_optional:
+                break
+        return has_coupling, has_optional
+    return bool(_COUPLING_HINTS_RE.search(lower)), bool(_OPTIONAL_HINTS_RE.search(lower))
+
+
+def _line_index(text: str) -> list[int]:
+    """Offsets of line beginnings; ``bisect_right(starts, offset)`` is a 1-based line number."""
+    starts = [0]
+    starts.extend(match.end() for match in _NEWLINE_RE.finditer(text))
+    return starts
+
+
+def scan_hard_coupling(skill_text: str, own_name: str, skill_lower: str | None = None) -> list[str]:
+    if skill_lower is None:
+        skill_lower = skill_text.lower()
+    # Cheap substring gate: skip all regex work on documents that cannot match.
+    if "bagakit-" not in skill_lower and "/skills/" not in skill_lower:
+        return []
+
+    # Match over the whole document and map offsets back to lines through one
+    # newline offset table instead of allocating a string per line.
+    line_starts = _line_index(skill_lower)
+    line_cache: dict[int, tuple[str, bool, bool]] = {}
+
+    def line_at(offset: int) -> tuple[int, str, bool, bool]:
+        idx = bisect_right(line_starts, offset)
+        cached = line_cache.get(idx)
+        if cached is None:
+            begin = line_starts[idx - 1]
+            end = line_starts[idx] - 1 if idx < len(line_starts) else len(skill_lower)
+            lower = skill_lower[begin:end]
+            cached = (lower, *_line_hint_kinds(lower))
+            line_cache[idx] = cached
+        return (idx, *cached)
+
+    found: list[tuple[int, int, str]] = []
+    if "bagakit-" in skill_lower:
+        for match in _BAGAKIT_REF_RE.finditer(skill_lower):
+            token = match.group(0)
             if token == own_name:
                 continue
             if token in NON_SKILL_BAGAKIT_TOKENS:
                 continue
-            if not any(hint in lower for hint in COUPLING_HINTS):
-                continue
-            if not line_is_optional_contract(lower):
-                errors.append(
-                    f"line {idx}: cross-skill reference '{token}' must be optional and contract/signal based"
+            idx, _lower, has_coupling, is_optional = line_at(match.start())
+            if has_coupling and not is_optional:
+                found.append(
+                    (idx, 0, f"line {idx}: cross-skill reference '{token}' must be optional and contract/signal based")
                 )
 
-        direct_skill_match = re.search(r"/skills/([a-z0-9-]+)", lower)
-        if direct_skill_match and re.search(r"\b(bash|sh|python3?|node)\b", lower):
-            target_skill = direct_skill_match.group(1)
-            if target_skill != own_name and not line_is_optional_contract(lower):
-                errors.append(
-                    f"line {idx}: direct call to other skill '{target_skill}' is not allowed without optional contract wording"
-                )
-    return errors
+    direct_seen: set[int] = set()
+    for match in _SKILLS_PATH_RE.finditer(skill_lower) if "/skills/" in skill_lower else ():
+        idx, lower, _has_coupling, is_optional = line_at(match.start())
+        if idx in direct_seen:
+            continue
+        direct_seen.add(idx)
+        if not _RUNNER_RE.search(lower):
+            continue
+        target_skill = match.group(1)
+        if target_skill != own_name and not is_optional:
+            found.append(
+                (idx, 1, f"line {idx}: direct call to other skill '{target_skill}' is not allowed without optional contract wording")
+            )
+
+    found.sort(key=lambda item: item[:2])
+    return [message for _idx, _order, message in found]
 
 
-def scan_metadata_contract_signals(skill_text: str) -> list[str]:
+def scan_metadata_contract_signals(skill_text: str, skill_lower: str | None = None) -> list[str]:
     warnings: list[str] = []
-    lower = skill_text.lower()
+    lower = skill_lower if skill_lower is not None else skill_text.lower()
 
-    found_discouraged: list[str] = []
-    for line in skill_text.splitlines():
-        line_lower = line.lower()
-        if any(hint in line_lower for hint in ANTI_PATTERN_HINTS):
+    found_discouraged: set[str] = set()
+    for line_lower in lower.splitlines():
+        if _ANTI_PATTERN_HINTS_RE.search(line_lower):
             continue
-        for key in DISCOURAGED_ADAPTER_KEYS:
-            if key in line_lower:
-                found_discouraged.append(key)
+        found_discouraged.update(match.group(0) for match in _DISCOURAGED_ADAPTER_KEYS_RE.finditer(line_lower))
 
-    unique_discouraged = sorted(set(found_discouraged))
-    if unique_discouraged:
+    if found_discouraged:
+        unique_discouraged = sorted(found_discouraged)
         warnings.append(
             "metadata contract may be over-coupled: found adapter-specific keys "
             f"{', '.join(unique_discouraged)}; prefer semantic keys like driver + driver_meta"
@@ -1492,9 +1761,10 @@ def scan_metadata_contract_signals(skill_text: str) -> list[str]:
     return warnings
 
 
-def scan_playbook_minimality(skill_dir: Path, skill_text: str) -> list[str]:
+def scan_playbook_minimality(skill_dir: Path, skill_text: str, skill_lower: str | None = None) -> list[str]:
     warnings: list[str] = []
-    skill_lower = skill_text.lower()
+    if skill_lower is None:
+        skill_lower = skill_text.lower()
 
     if not any(token in skill_lower for token in PLAYBOOK_MINIMALITY_HINTS):
         warnings.append(
@@ -1502,32 +1772,35 @@ def scan_playbook_minimality(skill_dir: Path, skill_text: str) -> list[str]:
             "if removing a file does not affect trigger/execution/output/archive, move it to docs/ and keep it out of payload"
         )
 
+    skill_dir_str = str(skill_dir)
+    rel_start = len(skill_dir_str) + 1
     for dirname in PLAYBOOK_DIR_ALIASES:
-        root = skill_dir / dirname
-        if not root.is_dir():
+        root = os.path.join(skill_dir_str, dirname)
+        if not os.path.isdir(root):
             continue
-        for path in sorted(root.rglob("*")):
-            if not path.is_file():
-                continue
-            if path.suffix.lower() not in {".md", ".txt"}:
+        hits: list[tuple[str, str]] = []
+        for name, fspath in _iter_files(root):
+            dot = name.rfind(".")
+            if dot <= 0 or name[dot:].lower() not in {".md", ".txt"}:
                 continue
-            stem = path.stem.lower()
+            stem = name[:dot].lower()
             if stem in {"readme", "start-here", "template-note"}:
                 continue
             hit = next((token for token in PLAYBOOK_PROCESS_FILENAME_HINTS if token in stem), None)
             if hit is None:
                 continue
-            rel = path.relative_to(skill_dir).as_posix()
-            warnings.append(
-                f"{rel} looks process-oriented ({hit}); if removing it does not affect skill runtime behavior, "
-                f"move it to {DOCS_DIR}/ and keep it out of payload"
-            )
+            hits.append((fspath[rel_start:], hit))
+        hits.sort()
+        warnings.extend(
+            f"{rel} looks process-oriented ({hit}); if removing it does not affect skill runtime behavior, "
+            f"move it to {DOCS_DIR}/ and keep it out of payload"
+            for rel, hit in hits
+        )
 
     return warnings
 
 
-def scan_skill_non_payload_references(skill_text: str, include: list[str]) -> list[str]:
-    errors: list[str] = []
+def scan_skill_non_payload_references(skill_text: str, include: list[str]) -> Iterator[str]:
     payload_roots = {item.split("/", 1)[0] for item in include}
     seen: set[tuple[str, str]] = set()
 
@@ -1541,33 +1814,36 @@ def scan_skill_non_payload_references(skill_text: str, include: list[str]) -> li
             continue
         seen.add(key)
         if root == DOCS_DIR:
-            errors.append(
+            yield (
                 f"SKILL.md references '{ref}', but '{DOCS_DIR}/' is not in SKILL_PAYLOAD include; "
                 "principle: if removing a doc does not affect runtime behavior, keep it in docs/ and do not reference it from SKILL.md "
                 "(原则: 删掉不影响技能使用的文档必须放入 docs，且 SKILL.md 不得引用)"
             )
             continue
-        errors.append(
+        yield (
             f"SKILL.md references '{ref}', but '{root}/' is not in SKILL_PAYLOAD include; "
             "principle: SKILL.md must only reference runtime payload paths "
             "(原则: SKILL.md 只能引用 SKILL_PAYLOAD 中会被打包的运行时路径)"
         )
 
-    return errors
-
 
-def scan_complexity_guardrails(skill_text: str, rules: dict[str, Any]) -> tuple[list[str], list[str]]:
+def scan_complexity_guardrails(
+    skill_text: str,
+    rules: dict[str, Any],
+    skill_lower: str | None = None,
+    sections: list[tuple[str, int, int]] | None = None,
+) -> tuple[list[str], list[str]]:
     errors: list[str] = []
     warnings: list[str] = []
     heading = str(rules.get("section_heading", "Complexity Guardrails"))
-    block = section_block(skill_text, rf"^##\s+{re.escape(heading)}(?:\s*\(.*\))?\s*$")
+    block = section_block(skill_text, rf"^##\s+{re.escape(heading)}(?:\s*\(.*\))?\s*$", sections)
     if block is None:
         errors.append(
             f"SKILL.md must include '## {heading}' section covering preset-heavy / implementation-heavy / too-many-defaults / over-hard-validation / scattered-constraints checks"
         )
         return errors, warnings
 
-    bullets = re.findall(r"(?m)^\s*[-*]\s+\S", block)
+    bullets = _BULLET_RE.findall(block)
     min_bullet_count = int(rules.get("min_bullet_count", 5))
     if len(bullets) < min_bullet_count:
         errors.append(f"{heading} section must include at least {min_bullet_count} bullet checks")
@@ -1586,7 +1862,8 @@ def scan_complexity_guardrails(skill_text: str, rules: dict[str, Any]) -> tuple[
     if review_hits < review_min_hits:
         warnings.append(f"{heading} section should include explicit review/check actions")
 
-    skill_lower = skill_text.lower()
+    if skill_lower is None:
+        skill_lower = skill_text.lower()
     default_count = len(re.findall(r"\bdefault\b|默认", skill_lower))
     default_threshold = int(rules.get("default_threshold", COMPLEXITY_DEFAULT_THRESHOLD))
     if default_count > default_threshold:
@@ -1628,90 +1905,177 @@ def scan_complexity_guardrails(skill_text: str, rules: dict[str, Any]) -> tuple[
     return errors, warnings
 
 
+def _iter_files(root: Path | str) -> list[tuple[str, str]]:
+    """Walk root with os.scandir and return (file name, file path) pairs.
+
+    Avoids constructing a Path object per directory entry the way rglob does;
+    callers materialize paths only when a finding is actually reported. The
+    listing is unsorted: callers that need deterministic output sort the few
+    findings (or scan targets) they keep, not the whole walk.
+    """
+    files: list[tuple[str, str]] = []
+    stack = deque([str(root)])
+    while stack:
+        current = stack.popleft()
+        try:
+            with os.scandir(current) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                    elif entry.is_file():
+                        # Follow file symlinks like the old rglob walk did;
+                        # only directory recursion stays no-follow (cycles).
+                        files.append((entry.name, entry.path))
+        except OSError:
+            continue
+    return files
+
+
+_STEM_CHARS = frozenset("abcdefghijklmnopqrstuvwxyz0123456789")
+
+
+def _classify_stem(stem: str) -> tuple[bool, set[str]]:
+    """Validate the stem charset and collect legacy tokens in one sweep."""
+    if "-" not in stem and "_" not in stem:
+        # Single-token fast path: membership scans in C, no per-char loop.
+        valid = bool(stem) and _STEM_CHARS.issuperset(stem)
+        return valid, ({stem} if stem in LEGACY_TERMS else set())
+    valid = bool(stem) and stem[0] in _STEM_CHARS
+    legacy: set[str] = set()
+    token_start = 0
+    for idx, ch in enumerate(stem):
+        if ch in _STEM_CHARS:
+            continue
+        if ch in "-_":
+            token = stem[token_start:idx]
+            if token in LEGACY_TERMS:
+                legacy.add(token)
+            token_start = idx + 1
+        else:
+            valid = False
+    tail = stem[token_start:]
+    if tail in LEGACY_TERMS:
+        legacy.add(tail)
+    return valid, legacy
+
+
 def audit_runtime_files(skill_dir: Path) -> tuple[list[str], list[str]]:
     errors: list[str] = []
     warnings: list[str] = []
-    runtime_dirs = {
-        "scripts": ALLOWED_SCRIPT_EXTENSIONS,
-        GATE_DIR: ALLOWED_GATE_EXTENSIONS,
-        PLAYBOOK_DIR_CANONICAL: ALLOWED_REFERENCE_EXTENSIONS,
-        PLAYBOOK_DIR_LEGACY: ALLOWED_REFERENCE_EXTENSIONS,
-        PLAYBOOK_DIR_OLDER: ALLOWED_REFERENCE_EXTENSIONS,
-        DOCS_DIR: ALLOWED_REFERENCE_EXTENSIONS,
-    }
-
-    for dirname, allowed_ext in runtime_dirs.items():
-        root = skill_dir / dirname
-        if not root.exists():
+    skill_dir_str = str(skill_dir)
+    # Every walked path shares the skill_dir prefix, so a slice replaces the
+    # per-file os.path.relpath parse.
+    rel_start = len(skill_dir_str) + 1
+    for dirname, allowed_ext in _RUNTIME_DIR_EXT.items():
+        root = os.path.join(skill_dir_str, dirname)
+        if not os.path.exists(root):
             continue
-        for path in sorted(root.rglob("*")):
-            if not path.is_file():
-                continue
-            if "__pycache__" in path.parts or path.suffix.lower() == ".pyc":
+        dir_errors: list[tuple[str, int, str]] = []
+        dir_warnings: list[tuple[str, int, str]] = []
+        for name, fspath in _iter_files(root):
+            dot = name.rfind(".")
+            stem = (name[:dot] if dot > 0 else name).lower()
+            suffix = (name[dot:] if dot > 0 else "").lower()
+            if suffix == ".pyc" or f"{os.sep}__pycache__{os.sep}" in fspath:
                 continue
-            rel = path.relative_to(skill_dir)
-            stem = path.stem.lower()
-            suffix = path.suffix.lower()
+            rel = fspath[rel_start:]
             if suffix and suffix not in allowed_ext:
-                warnings.append(f"unexpected extension under {dirname}: {rel}")
+                dir_warnings.append((rel, 0, f"unexpected extension under {dirname}: {rel}"))
 
-            if not FILE_STEM_RE.match(stem):
-                errors.append(f"file name must be lowercase/digits/hyphen/underscore only: {rel}")
+            valid_stem, bad_terms = _classify_stem(stem)
+            if not valid_stem:
+                dir_errors.append((rel, 0, f"file name must be lowercase/digits/hyphen/underscore only: {rel}"))
 
             if stem in GENERIC_FILE_STEMS:
-                errors.append(f"file name is too generic (not self-explanatory): {rel}")
+                dir_errors.append((rel, 1, f"file name is too generic (not self-explanatory): {rel}"))
 
-            tokens = [tok for tok in re.split(r"[-_]+", stem) if tok]
-            bad_terms = sorted(set(tok for tok in tokens if tok in LEGACY_TERMS))
             if bad_terms and stem not in LEGACY_TERM_ALLOWLIST_STEMS:
-                errors.append(
-                    f"file name contains legacy/workaround term {bad_terms}; rewrite to final-state naming: {rel}"
+                dir_errors.append(
+                    (rel, 2, f"file name contains legacy/workaround term {sorted(bad_terms)}; rewrite to final-state naming: {rel}")
                 )
 
-            if "_" in path.name:
-                warnings.append(f"prefer hyphen-case file naming for clarity: {rel}")
+            if "_" in name:
+                dir_warnings.append((rel, 1, f"prefer hyphen-case file naming for clarity: {rel}"))
+
+        # Sort the findings, not the walk; most files report nothing.
+        dir_errors.sort()
+        dir_warnings.sort()
+        errors.extend(message for _rel, _order, message in dir_errors)
+        warnings.extend(message for _rel, _order, message in dir_warnings)
 
     return errors, warnings
 
 
-def scan_absolute_path_literals(skill_dir: Path, include: list[str]) -> list[str]:
-    targets: set[Path] = set()
+def scan_absolute_path_literals(
+    skill_dir: Path, include: list[str], *, preloaded: dict[Path, str] | None = None
+) -> Iterator[str]:
+    targets: set[str] = set()
+    skill_dir_str = str(skill_dir)
 
-    def add_target(path: Path) -> None:
-        if path.name == "SKILL.md" or path.suffix.lower() in ABSOLUTE_PATH_SCAN_EXTENSIONS:
-            targets.add(path)
+    def add_target(name: str, fspath: str) -> None:
+        dot = name.rfind(".")
+        if name == "SKILL.md" or (dot > 0 and name[dot:].lower() in ABSOLUTE_PATH_SCAN_EXTENSIONS):
+            targets.add(fspath)
 
     # Always scan SKILL.md, then scan payload/runtime text files.
-    add_target(skill_dir / "SKILL.md")
+    add_target("SKILL.md", os.path.join(skill_dir_str, "SKILL.md"))
     scan_roots = include[:] if include else [*PLAYBOOK_DIR_ALIASES, DOCS_DIR, GATE_DIR, "agents"]
 
     for rel in scan_roots:
-        path = skill_dir / rel
-        if not path.exists():
+        root = os.path.join(skill_dir_str, rel)
+        if os.path.isfile(root):
+            add_target(os.path.basename(root), root)
             continue
-        if path.is_file():
-            add_target(path)
-            continue
-        for child in sorted(path.rglob("*")):
-            if child.is_file():
-                add_target(child)
+        for name, fspath in _iter_files(root):
+            add_target(name, fspath)
+
+    preloaded_by_str = {str(path): text for path, text in preloaded.items()} if preloaded else {}
+    rel_start = len(skill_dir_str) + 1
+
+    def scan_one(fspath: str) -> list[str]:
+        text: str | bytes | None = preloaded_by_str.get(fspath)
+        if text is not None:
+            pattern: re.Pattern = _ABSOLUTE_PATH_ANY_RE
+            newline_re: re.Pattern = _NEWLINE_RE
+            allowed_prefixes: tuple = ABSOLUTE_PATH_ALLOWED_PREFIXES
+        else:
+            text = Path(fspath).read_bytes()
+            if b"\x00" in text[:4096]:
+                # Binary file; the old decode-and-skip behavior, without the decode.
+                return []
+            pattern = _ABSOLUTE_PATH_ANY_B_RE
+            newline_re = _NEWLINE_B_RE
+            allowed_prefixes = _ABSOLUTE_PATH_ALLOWED_PREFIXES_B
+        rel = fspath[rel_start:]
+        line_starts: list[int] | None = None
+        reported_lines: set[int] = set()
+        found: list[str] = []
+        for match in pattern.finditer(text):
+            if match.group(0).startswith(allowed_prefixes):
+                continue
+            if line_starts is None:
+                line_starts = [newline.start() for newline in newline_re.finditer(text)]
+            idx = bisect_right(line_starts, match.start()) + 1
+            if idx in reported_lines:
+                continue
+            reported_lines.add(idx)
+            found.append(
+                f"{rel}:{idx} contains absolute path literal; use relative paths or env variables in generated files"
+            )
+        return found
 
-    errors: list[str] = []
-    for path in sorted(targets):
-        try:
-            text = path.read_text(encoding="utf-8")
-        except UnicodeDecodeError:
-            continue
-        rel = path.relative_to(skill_dir).as_posix()
-        for idx, line in enumerate(text.splitlines(), 1):
-            literals = [match.group(0) for match in ABSOLUTE_POSIX_RE.finditer(line)]
-            literals.extend(match.group(0) for match in ABSOLUTE_WINDOWS_RE.finditer(line))
-            leaked = [literal for literal in literals if not literal.startswith(ABSOLUTE_PATH_ALLOWED_PREFIXES)]
-            if leaked:
-                errors.append(
-                    f"{rel}:{idx} contains absolute path literal; use relative paths or env variables in generated files"
-                )
-    return errors
+    ordered = sorted(targets)
+    if len(ordered) > 8:
+        # The reads release the GIL, so a small pool overlaps file I/O;
+        # map() keeps result order, so output matches the serial path.
+        from concurrent.futures import ThreadPoolExecutor
+
+        with ThreadPoolExecutor(max_workers=min(8, os.cpu_count() or 1)) as pool:
+            for found in pool.map(scan_one, ordered):
+                yield from found
+    else:
+        for fspath in ordered:
+            yield from scan_one(fspath)
 
 
 def collect_script_files_for_lint(skill_dir: Path, include: list[str]) -> dict[str, list[Path]]:
@@ -1758,6 +2122,10 @@ def collect_script_files_for_lint(skill_dir: Path, include: list[str]) -> dict[s
 
 
 def run_script_lint_gate(skill_dir: Path, include: list[str]) -> list[str]:
+    # Deferred imports: only the runtime-gate command shells out to linters.
+    import shutil
+    import subprocess
+
     script_files = collect_script_files_for_lint(skill_dir, include)
     errors: list[str] = []
 
@@ -1860,7 +2228,7 @@ def run_script_lint_gate(skill_dir: Path, include: list[str]) -> list[str]:
     return errors
 
 
-def scan_nonlocal_script_resolution(skill_dir: Path) -> list[str]:
+def scan_nonlocal_script_resolution(skill_dir: Path) -> Iterator[str]:
     targets: set[Path] = set()
 
     for rel in ("SKILL.md", "README.md", "AGENTS.md", "docs", "scripts", GATE_DIR):
@@ -1889,7 +2257,6 @@ def scan_nonlocal_script_resolution(skill_dir: Path) -> list[str]:
             ):
                 targets.add(path)
 
-    errors: list[str] = []
     for path in sorted(targets):
         try:
             text = path.read_text(encoding="utf-8")
@@ -1901,13 +2268,11 @@ def scan_nonlocal_script_resolution(skill_dir: Path) -> list[str]:
                 continue
             if not any(hint in line for hint in SCRIPT_LOOKUP_CONTEXT_HINTS):
                 continue
-            errors.append(
+            yield (
                 f"{rel}:{idx} uses ~/.bagakit or BAGAKIT_HOME fallback for skill script/playbook lookup; "
                 "resolve from local skill payload or explicit env only (missing script is a bug)"
             )
 
-    return errors
-
 
 def cmd_runtime_gate(args: argparse.Namespace) -> int:
     skill_dir = Path(args.skill_dir).expanduser().resolve()
@@ -1915,13 +2280,17 @@ def cmd_runtime_gate(args: argparse.Namespace) -> int:
 
     skill_md = skill_dir / "SKILL.md"
     payload_file = skill_dir / "SKILL_PAYLOAD.json"
-    if not skill_md.exists():
+    # One directory read answers every top-level existence question below.
+    try:
+        top_entries = {entry.name for entry in os.scandir(skill_dir)}
+    except OSError:
+        top_entries = set()
+    if "SKILL.md" not in top_entries:
         errors.append(f"missing file: {skill_md}")
-    if not payload_file.exists():
+    if "SKILL_PAYLOAD.json" not in top_entries:
         errors.append(f"missing file: {payload_file}")
     if errors:
-        for err in errors:
-            eprint(f"error: {err}")
+        eprint_errors(errors)
         return 1
 
     payload, payload_errors = load_payload(payload_file)
@@ -1935,8 +2304,7 @@ def cmd_runtime_gate(args: argparse.Namespace) -> int:
             include = raw_include
 
     if errors:
-        for err in errors:
-            eprint(f"error: {err}")
+        eprint_errors(errors)
         return 1
 
     scan_roots: list[str] = []
@@ -1951,31 +2319,122 @@ def cmd_runtime_gate(args: argparse.Namespace) -> int:
     errors.extend(run_script_lint_gate(skill_dir, include))
 
     if errors:
-        for err in errors:
-            eprint(f"error: {err}")
+        eprint_errors(errors)
         return 1
 
-    print("ok: runtime gate passed")
+    sys.stdout.write("ok: runtime gate passed\n")
     return 0
 
 
+def _validation_cache_dir() -> str:
+    base = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    return os.path.join(base, "bagakit-skill-maker", "validated")
+
+
+def _validation_cache_key(skill_dir: Path, *, strict_authority: bool) -> str | None:
+    """Digest every entry's (path, type, stats) under skill_dir; None on walk errors.
+
+    Directories count too — layout checks react to empty dirs, so adding or
+    removing one must bump the key even though no file stats change.  Any
+    content change bumps an mtime and therefore the key, so markers never need
+    explicit invalidation.  The validator's own stat is folded in so upgrading
+    the tool retires every marker written by the old checks.  Trees with
+    symlinked directories opt out of caching entirely.
+    """
+    from hashlib import blake2b
+
+    digest = blake2b(digest_size=16)
+    try:
+        tool = os.stat(__file__)
+    except OSError:
+        return None
+    digest.update(f"{tool.st_mtime_ns}\x00{tool.st_size}\x00{skill_dir}\x00{int(strict_authority)}".encode())
+    stack = deque([str(skill_dir)])
+    while stack:
+        current = stack.popleft()
+        try:
+            with os.scandir(current) as entries:
+                listing = sorted(entries, key=lambda entry: entry.name)
+            for entry in listing:
+                if entry.is_dir(follow_symlinks=False):
+                    digest.update(f"{entry.path}\x00dir\x00".encode())
+                    stack.append(entry.path)
+                    continue
+                st = entry.stat(follow_symlinks=False)
+                digest.update(f"{entry.path}\x00{st.st_mtime_ns}\x00{st.st_size}\x00".encode())
+                if entry.is_symlink():
+                    if entry.is_dir():
+                        # Changes behind a linked dir are invisible to this
+                        # walk; never trust a marker for such a tree.
+                        return None
+                    try:
+                        target = entry.stat()
+                        digest.update(f"{target.st_mtime_ns}\x00{target.st_size}\x00".encode())
+                    except OSError:
+                        digest.update(b"dangling\x00")
+        except OSError:
+            return None
+    return digest.hexdigest()
+
+
 def cmd_validate(args: argparse.Namespace) -> int:
     skill_dir = Path(args.skill_dir).expanduser().resolve()
+    fail_fast = bool(getattr(args, "fail_fast", False))
     errors: list[str] = []
     warnings: list[str] = []
 
+    def bail() -> int:
+        print_warnings(warnings)
+        eprint_errors(errors)
+        return 1
+
     skill_md = skill_dir / "SKILL.md"
     payload_file = skill_dir / "SKILL_PAYLOAD.json"
-    if not skill_md.exists():
+    # One directory read answers every top-level existence question below.
+    try:
+        top_entries = {entry.name for entry in os.scandir(skill_dir)}
+    except OSError:
+        top_entries = set()
+    if "SKILL.md" not in top_entries:
         errors.append(f"missing file: {skill_md}")
-    if not payload_file.exists():
+    if "SKILL_PAYLOAD.json" not in top_entries:
         errors.append(f"missing file: {payload_file}")
     if errors:
-        for err in errors:
-            eprint(f"error: {err}")
+        eprint_errors(errors)
         return 1
 
-    skill_text = skill_md.read_text(encoding="utf-8")
+    # Warm-cache fast path: when no file's (mtime, size) changed since a fully
+    # clean validation with the same flags, skip the scans; the mtime sweep is
+    # the only filesystem work a warm run pays for.
+    cache_key = _validation_cache_key(skill_dir, strict_authority=bool(args.strict_authority))
+    if cache_key is not None and os.path.exists(os.path.join(_validation_cache_dir(), cache_key)):
+        sys.stdout.write("ok: skill validation passed (cached)\n")
+        return 0
+
+    # One fd-level read and one decode instead of the TextIOWrapper stack;
+    # the trailing loop covers the (rare) short read on a regular file.
+    fd = os.open(os.path.join(str(skill_dir), "SKILL.md"), os.O_RDONLY)
+    try:
+        size = os.fstat(fd).st_size
+        skill_bytes = os.read(fd, size)
+        while len(skill_bytes) < size:
+            chunk = os.read(fd, size - len(skill_bytes))
+            if not chunk:
+                break
+            skill_bytes += chunk
+    finally:
+        os.close(fd)
+    skill_text = skill_bytes.decode("utf-8")
+    if "\r" in skill_text:
+        # read_text() translated universal newlines; preserve that contract.
+        skill_text = skill_text.replace("\r\n", "\n").replace("\r", "\n")
+    skill_lower = skill_text.lower()
+    sections = index_sections(skill_text)
+    doc_flags: set[str | None] = set()
+    for flag_match in _FUSED_DOC_RE.finditer(skill_text):
+        doc_flags.add(flag_match.lastgroup)
+        if len(doc_flags) == len(_FUSED_DOC_RE.groupindex):
+            break
     fm, fm_errors = parse_frontmatter(skill_text)
     errors.extend(fm_errors)
     allowed_keys = {"name", "description"}
@@ -1985,6 +2444,7 @@ def cmd_validate(args: argparse.Namespace) -> int:
 
     name = fm.get("name", "")
     description = fm.get("description", "")
+    desc_lower = description.lower()
     is_bagakit_series = bool(name) and name.startswith("bagakit-")
     if not name:
         errors.append("frontmatter missing required key: name")
@@ -1992,13 +2452,16 @@ def cmd_validate(args: argparse.Namespace) -> int:
         errors.append("frontmatter name is invalid; expected lowercase letters/digits/hyphens, max 64 chars")
     if not description:
         errors.append("frontmatter missing required key: description")
-    elif any(hint in description for hint in PLACEHOLDER_HINTS):
+    elif _PLACEHOLDER_HINTS_RE.search(description):
         errors.append("frontmatter description still looks like placeholder text")
-    elif not re.search(r"\bwhen\b|适用|当|用于", description.lower()):
+    elif not _TRIGGER_RE.search(desc_lower):
         errors.append("frontmatter description should include clear trigger wording (e.g. 'use when ...')")
     if description and len(description) < 40:
         warnings.append("frontmatter description may be too short for accurate triggering")
 
+    if fail_fast and errors:
+        return bail()
+
     payload, payload_errors = load_payload(payload_file)
     errors.extend(payload_errors)
     include: list[str] = []
@@ -2011,7 +2474,9 @@ def cmd_validate(args: argparse.Namespace) -> int:
 
     if include:
         include_set = set(include)
-        has_playbook_canonical, has_playbook_legacy, has_playbook_older = detect_playbook_layout(skill_dir)
+        has_playbook_canonical, has_playbook_legacy, has_playbook_older = detect_playbook_layout(
+            skill_dir, top_entries
+        )
         has_playbook_include = any(item in include_set for item in PLAYBOOK_DIR_ALIASES)
         if len(include_set) != len(include):
             errors.append("SKILL_PAYLOAD.json include contains duplicate items")
@@ -2023,14 +2488,32 @@ def cmd_validate(args: argparse.Namespace) -> int:
             warnings.append(
                 f"payload includes {DOCS_DIR}/; prefer excluding process docs from runtime payload unless explicitly required"
             )
+        skill_dir_str = str(skill_dir)
+        # For larger payloads one directory walk beats a stat per entry.
+        present: set[str] | None = None
+        if len(include) >= 4:
+            present = set()
+            for dirpath, dirnames, filenames in os.walk(skill_dir_str):
+                rel_dir = os.path.relpath(dirpath, skill_dir_str)
+                prefix = "" if rel_dir == "." else rel_dir + "/"
+                present.update(prefix + entry for entry in dirnames)
+                present.update(prefix + entry for entry in filenames)
         for path in include:
-            if path.startswith("/") or ".." in Path(path).parts:
+            # Pure string checks covering the traversal cases Path.parts
+            # would flag, without a PurePath allocation per entry.
+            if path.startswith(("/", "../")) or "/../" in path or path.endswith("/..") or path == "..":
                 errors.append(f"payload path must stay inside skill directory: {path}")
                 continue
-            if not (skill_dir / path).exists():
+            if present is not None:
+                # The walk does not descend symlinked dirs; stat before
+                # declaring an entry missing so links resolve as before.
+                exists = path.rstrip("/") in present or os.path.exists(os.path.join(skill_dir_str, path))
+            else:
+                exists = os.path.exists(os.path.join(skill_dir_str, path))
+            if not exists:
                 errors.append(f"payload path missing on disk: {path}")
         for runtime_dir in ("scripts", "agents", GATE_DIR):
-            exists = (skill_dir / runtime_dir).exists()
+            exists = runtime_dir in top_entries
             has = runtime_dir in include_set
             if exists and not has:
                 warnings.append(f"directory exists but not included in payload: {runtime_dir}")
@@ -2049,11 +2532,11 @@ def cmd_validate(args: argparse.Namespace) -> int:
         if PLAYBOOK_DIR_OLDER in include_set and not has_playbook_older:
             errors.append(f"payload includes missing directory: {PLAYBOOK_DIR_OLDER}")
 
-        if has_playbook_canonical and not (skill_dir / PLAYBOOK_DIR_CANONICAL / "tpl").is_dir():
+        if has_playbook_canonical and not os.path.isdir(os.path.join(skill_dir_str, PLAYBOOK_DIR_CANONICAL, "tpl")):
             warnings.append("playbook layout should include playbook/tpl for reusable templates")
-        if has_playbook_legacy and not (skill_dir / PLAYBOOK_DIR_LEGACY / "tpl").is_dir():
+        if has_playbook_legacy and not os.path.isdir(os.path.join(skill_dir_str, PLAYBOOK_DIR_LEGACY, "tpl")):
             warnings.append("legacy reference layout should include reference/tpl for reusable templates")
-        if has_playbook_older and not (skill_dir / PLAYBOOK_DIR_OLDER / "tpl").is_dir():
+        if has_playbook_older and not os.path.isdir(os.path.join(skill_dir_str, PLAYBOOK_DIR_OLDER, "tpl")):
             warnings.append("legacy references layout should include references/tpl for reusable templates")
 
         if has_playbook_legacy and not has_playbook_canonical:
@@ -2066,18 +2549,21 @@ def cmd_validate(args: argparse.Namespace) -> int:
             )
         errors.extend(scan_skill_non_payload_references(skill_text, include))
 
+    if fail_fast and errors:
+        return bail()
+
     discovery_errors, discovery_warnings = scan_discovery_evidence(
         skill_dir, strict_authority=bool(args.strict_authority)
     )
     errors.extend(discovery_errors)
     warnings.extend(discovery_warnings)
 
-    lines = skill_text.splitlines()
-    if len(lines) > MAX_SKILL_LINES:
-        errors.append(f"SKILL.md must stay within {MAX_SKILL_LINES} lines (current={len(lines)})")
+    line_count = skill_text.count("\n") + (1 if skill_text and not skill_text.endswith("\n") else 0)
+    if line_count > MAX_SKILL_LINES:
+        errors.append(f"SKILL.md must stay within {MAX_SKILL_LINES} lines (current={line_count})")
 
-    has_bagakit_anchor = bool(re.search(r"(?m)^\[\[BAGAKIT\]\]\s*$", skill_text))
-    has_bagakit_peer_lines = bool(re.search(r"(?m)^\[\[BAGAKIT\]\]\s*\n(?:- .+\n)+", skill_text))
+    has_bagakit_peer_lines = "bagakit_peer" in doc_flags
+    has_bagakit_anchor = has_bagakit_peer_lines or "bagakit_anchor" in doc_flags
     if not has_bagakit_anchor:
         if is_bagakit_series:
             errors.append("SKILL.md must define [[BAGAKIT]] footer contract for bagakit-* skills")
@@ -2087,55 +2573,31 @@ def cmd_validate(args: argparse.Namespace) -> int:
             )
     elif is_bagakit_series and not has_bagakit_peer_lines:
         errors.append("bagakit-* skills must keep canonical [[BAGAKIT]] format: anchor line followed by peer '- ...' lines")
-    if "standalone" not in skill_text.lower():
+    if "standalone" not in doc_flags:
         errors.append("SKILL.md must state standalone-first design explicitly")
-    if not (
-        "optional" in skill_text.lower()
-        and any(key in skill_text.lower() for key in ("contract", "schema", "signal", "契约", "信号"))
-    ):
+    if not ("optional" in doc_flags and "contract" in doc_flags):
         errors.append("SKILL.md must describe optional cross-skill contract/signal exchange")
-    if "## Workflow" not in skill_text:
+    if "workflow" not in doc_flags:
         errors.append("SKILL.md must include a '## Workflow' section")
-    if not section_has_bullets(skill_text, r"^##\s+When to Use(?: This Skill)?\s*$", min_count=2):
-        errors.append("SKILL.md must include '## When to Use' section with at least 2 bullet items")
-    if not section_has_bullets(skill_text, r"^##\s+When NOT to Use(?: This Skill)?\s*$", min_count=2):
-        errors.append("SKILL.md must include '## When NOT to Use' section with at least 2 bullet items")
-    if not section_has_bullets(
-        skill_text,
-        r"^##\s+(?:Fallback Path(?:\s*\(.*\))?|When No Clear Fit(?:\s*\(.*\))?)\s*$",
-        min_count=1,
-    ):
-        errors.append("SKILL.md must include a fallback section with at least 1 bullet action")
-    if not section_has_bullets(
-        skill_text,
-        r"^##\s+(?:Output Routes(?: and Default Mode)?|Output Contract|Output System Contract)\s*$",
-        min_count=2,
-    ):
-        errors.append("SKILL.md must include output routes/default section with at least 2 bullet items")
-    if not section_has_bullets(
-        skill_text,
-        r"^##\s+(?:Archive Gate(?:\s*\(.*\))?|Completion Handoff(?: and Archive)?|Archive(?: and Handoff)?)\s*$",
-        min_count=1,
-    ):
-        errors.append("SKILL.md must include archive gate/hand-off section with at least 1 bullet action")
+    for heading_pattern, min_count, message in _REQUIRED_BULLET_SECTIONS:
+        if not section_has_bullets(skill_text, heading_pattern, min_count=min_count, sections=sections):
+            errors.append(message)
 
-    output_block = section_block(
-        skill_text, r"^##\s+(?:Output Routes(?: and Default Mode)?|Output Contract|Output System Contract)\s*$"
-    )
+    output_block = section_block(skill_text, _HEADING_OUTPUT_RE, sections)
     output_lower = output_block.lower() if output_block else ""
     if output_block:
         if "default" not in output_lower:
             errors.append("output section must explicitly mention default route behavior")
-        has_adapter_route = any(token in output_lower for token in ADAPTER_HINTS)
-        has_no_adapter_policy = any(token in output_lower for token in NO_ADAPTER_HINTS)
+        has_adapter_route = bool(_ADAPTER_HINTS_RE.search(output_lower))
+        has_no_adapter_policy = bool(_NO_ADAPTER_HINTS_RE.search(output_lower))
         if not (has_adapter_route or has_no_adapter_policy):
             errors.append(
                 "output section must declare adapter policy: optional adapter routes or explicit standalone/no-adapter statement"
             )
         if has_adapter_route and "optional" not in output_lower and "可选" not in output_lower:
             warnings.append("adapter routes should be marked optional to preserve standalone-first behavior")
-        has_concrete_adapter_names = any(token in output_lower for token in CONCRETE_ADAPTER_HINTS)
-        has_generic_adapter_terms = any(token in output_lower for token in GENERIC_ADAPTER_HINTS)
+        has_concrete_adapter_names = bool(_CONCRETE_ADAPTER_HINTS_RE.search(output_lower))
+        has_generic_adapter_terms = bool(_GENERIC_ADAPTER_HINTS_RE.search(output_lower))
         if has_concrete_adapter_names and not has_generic_adapter_terms:
             warnings.append(
                 "output routing appears concrete-name-bound; describe generic adapter classes/capability rules first, "
@@ -2145,25 +2607,23 @@ def cmd_validate(args: argparse.Namespace) -> int:
             warnings.append(
                 "fallback wording is too narrow; cover no external driver usable (not detected / unresolved / invalid contract)"
             )
-        if not any(token in output_lower for token in ACTION_HINTS):
+        if not _ACTION_HINTS_RE.search(output_lower):
             errors.append("output section must define an action handoff output")
-        has_memory = any(token in output_lower for token in MEMORY_HINTS)
+        has_memory = bool(_MEMORY_HINTS_RE.search(output_lower))
         has_memory_none = any(token in output_lower for token in ("no memory", "none", "无沉淀", "无记忆", "无需沉淀"))
         if not (has_memory or has_memory_none):
             errors.append("output section must define a memory/summary handoff output (or explicit none rationale)")
         if not any(token in output_lower for token in ("archetype", "type", "分类", "类别", "产物")):
             warnings.append("output section should classify deliverable archetype/type")
 
-    archive_block = section_block(
-        skill_text, r"^##\s+(?:Archive Gate(?:\s*\(.*\))?|Completion Handoff(?: and Archive)?|Archive(?: and Handoff)?)\s*$"
-    )
+    archive_block = section_block(skill_text, _HEADING_ARCHIVE_RE, sections)
     archive_lower = archive_block.lower() if archive_block else ""
     if archive_block:
-        if not any(token in archive_lower for token in ARCHIVE_HINTS):
+        if not _ARCHIVE_HINTS_RE.search(archive_lower):
             errors.append("archive section must explicitly include destination path/id evidence")
-        if not any(token in archive_lower for token in ACTION_HINTS):
+        if not _ACTION_HINTS_RE.search(archive_lower):
             errors.append("archive section must mention action handoff destination")
-        has_archive_memory = any(token in archive_lower for token in MEMORY_HINTS)
+        has_archive_memory = bool(_MEMORY_HINTS_RE.search(archive_lower))
         has_archive_memory_none = any(
             token in archive_lower for token in ("no memory", "none", "无沉淀", "无记忆", "无需沉淀")
         )
@@ -2172,72 +2632,201 @@ def cmd_validate(args: argparse.Namespace) -> int:
         if not any(token in archive_lower for token in ("complete", "completion", "gate", "准出", "完成")):
             warnings.append("archive section should state completion gate conditions explicitly")
 
-    errors.extend(scan_hard_coupling(skill_text, name or ""))
-    warnings.extend(scan_metadata_contract_signals(skill_text))
-    warnings.extend(scan_playbook_minimality(skill_dir, skill_text))
+    if fail_fast and errors:
+        return bail()
+
     gate_errors, gate_warnings = scan_gate_layout(skill_dir)
-    errors.extend(gate_errors)
-    warnings.extend(gate_warnings)
     complexity_rules, complexity_rule_errors, complexity_rule_warnings = load_complexity_gate_rules(skill_dir)
-    errors.extend(complexity_rule_errors)
-    warnings.extend(complexity_rule_warnings)
-    complexity_errors, complexity_warnings = scan_complexity_guardrails(skill_text, complexity_rules)
-    errors.extend(complexity_errors)
-    warnings.extend(complexity_warnings)
+    complexity_errors, complexity_warnings = scan_complexity_guardrails(skill_text, complexity_rules, skill_lower, sections)
     runtime_errors, runtime_warnings = audit_runtime_files(skill_dir)
-    errors.extend(runtime_errors)
-    warnings.extend(runtime_warnings)
-    errors.extend(scan_absolute_path_literals(skill_dir, include))
-
-    if "bash .bagakit/" in skill_text:
-        warnings.append(
-            "SKILL.md contains direct '.bagakit' script call; ensure this is optional and not a hard dependency"
+    # One extend per sink instead of one list-growth call per scan.
+    error_stream = chain(
+        scan_hard_coupling(skill_text, name or "", skill_lower),
+        gate_errors,
+        complexity_rule_errors,
+        complexity_errors,
+        runtime_errors,
+        scan_absolute_path_literals(skill_dir, include, preloaded={skill_md: skill_text}),
+    )
+    if fail_fast:
+        # Take the first finding and let the unconsumed scans go unrun.
+        first = next(error_stream, None)
+        if first is not None:
+            errors.append(first)
+            return bail()
+    else:
+        errors.extend(error_stream)
+    warnings.extend(
+        chain(
+            scan_metadata_contract_signals(skill_text, skill_lower),
+            scan_playbook_minimality(skill_dir, skill_text, skill_lower),
+            gate_warnings,
+            complexity_rule_warnings,
+            complexity_warnings,
+            runtime_warnings,
         )
+    )
+
+    warnings.extend(message for flag, message in _DOC_FLAG_WARNINGS.items() if flag in doc_flags)
 
-    for warning in warnings:
-        print(f"warn: {warning}")
     if errors:
-        for err in errors:
-            eprint(f"error: {err}")
-        return 1
+        return bail()
+    print_warnings(warnings)
 
-    print("ok: skill validation passed")
     if warnings:
-        print(f"warn_count={len(warnings)}")
+        sys.stdout.write(f"ok: skill validation passed\nwarn_count={len(warnings)}\n")
+    else:
+        sys.stdout.write("ok: skill validation passed\n")
+    if not warnings and cache_key is not None:
+        # Only fully clean runs get a marker: a cached hit replays no warnings.
+        cache_dir = _validation_cache_dir()
+        try:
+            os.makedirs(cache_dir, exist_ok=True)
+            with open(os.path.join(cache_dir, cache_key), "w", encoding="utf-8"):
+                pass
+            # Markers invalidated by edits or tool upgrades are never touched
+            # again; sweep anything older than 30 days while we are here.
+            import time
+
+            cutoff = time.time() - 30 * 86400
+            with os.scandir(cache_dir) as markers:
+                for marker in markers:
+                    if marker.name != cache_key and marker.stat().st_mtime < cutoff:
+                        os.unlink(marker.path)
+        except OSError:
+            pass
     return 0
 
 
-def build_parser() -> argparse.ArgumentParser:
-    parser = argparse.ArgumentParser(description="Bagakit skill scaffolder and validator")
-    sub = parser.add_subparsers(dest="command", required=True)
-
-    p_init = sub.add_parser("init", help="create a new skill skeleton")
+def _add_init_parser(sub: argparse._SubParsersAction) -> None:
+    p_init = sub.add_parser("init", help="create a new skill skeleton", allow_abbrev=False)
     p_init.add_argument("--name", required=True, help="skill name (hyphen-case)")
     p_init.add_argument("--path", default=".", help="parent output directory")
     p_init.add_argument("--with-agents", action="store_true", help="also create agents/openai.yaml")
-    p_init.set_defaults(func=cmd_init)
 
-    p_validate = sub.add_parser("validate", help="validate a skill folder")
+
+def _add_validate_parser(sub: argparse._SubParsersAction) -> None:
+    p_validate = sub.add_parser("validate", help="validate a skill folder", allow_abbrev=False)
     p_validate.add_argument("--skill-dir", required=True)
     p_validate.add_argument(
         "--strict-authority",
         action="store_true",
         help="treat discovery authority gate violations as hard errors",
     )
-    p_validate.set_defaults(func=cmd_validate)
+    p_validate.add_argument(
+        "--fail-fast",
+        action="store_true",
+        help="stop at the first error instead of collecting all findings",
+    )
+
 
-    p_runtime_gate = sub.add_parser("runtime-gate", help="enforce runtime hard gates (path + script lint)")
+def _add_runtime_gate_parser(sub: argparse._SubParsersAction) -> None:
+    p_runtime_gate = sub.add_parser(
+        "runtime-gate", help="enforce runtime hard gates (path + script lint)", allow_abbrev=False
+    )
     p_runtime_gate.add_argument("--skill-dir", required=True)
-    p_runtime_gate.set_defaults(func=cmd_runtime_gate)
 
+
+_SUBPARSER_BUILDERS = {
+    "init": _add_init_parser,
+    "validate": _add_validate_parser,
+    "runtime-gate": _add_runtime_gate_parser,
+}
+
+# Hand-rolled parsing tables for the documented flag forms: per command, the
+# handler, {flag: (dest, takes_value)}, defaults, and required dests.
+_CLI_SPECS: dict[str, tuple[Any, dict[str, tuple[str, bool]], dict[str, Any], tuple[str, ...]]] = {
+    "init": (
+        cmd_init,
+        {"--name": ("name", True), "--path": ("path", True), "--with-agents": ("with_agents", False)},
+        {"name": None, "path": ".", "with_agents": False},
+        ("name",),
+    ),
+    "validate": (
+        cmd_validate,
+        {
+            "--skill-dir": ("skill_dir", True),
+            "--strict-authority": ("strict_authority", False),
+            "--fail-fast": ("fail_fast", False),
+        },
+        {"skill_dir": None, "strict_authority": False, "fail_fast": False},
+        ("skill_dir",),
+    ),
+    "runtime-gate": (
+        cmd_runtime_gate,
+        {"--skill-dir": ("skill_dir", True)},
+        {"skill_dir": None},
+        ("skill_dir",),
+    ),
+}
+
+
+def _fast_parse(command: str, rest: list[str]) -> SimpleNamespace | None:
+    """Parse the exact documented flag forms without argparse.
+
+    Returns None for anything unrecognized (help flags, ``--flag=value``
+    forms, abbreviations, typos) so the argparse fallback can report it.
+    """
+    _func, flags, defaults, required = _CLI_SPECS[command]
+    values = dict(defaults)
+    idx = 0
+    while idx < len(rest):
+        entry = flags.get(rest[idx])
+        if entry is None:
+            return None
+        dest, takes_value = entry
+        if takes_value:
+            idx += 1
+            if idx >= len(rest) or rest[idx].startswith("-"):
+                return None
+            values[dest] = rest[idx]
+        else:
+            values[dest] = True
+        idx += 1
+    if any(values[dest] is None for dest in required):
+        return None
+    return SimpleNamespace(**values)
+
+
+@functools.cache
+def build_parser(command: str | None = None) -> argparse.ArgumentParser:
+    # Deferred import: the fast-path dispatch in main() never needs argparse.
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Bagakit skill scaffolder and validator", allow_abbrev=False)
+    sub = parser.add_subparsers(dest="command", required=True)
+    # Register only the selected subcommand when it is known; registering all
+    # three costs measurable startup time on every short CLI run.
+    builder = _SUBPARSER_BUILDERS.get(command or "")
+    if builder is not None:
+        builder(sub)
+    else:
+        for build in _SUBPARSER_BUILDERS.values():
+            build(sub)
     return parser
 
 
 def main() -> int:
-    parser = build_parser()
+    command = sys.argv[1] if len(sys.argv) > 1 else None
+    # Fast path: dispatch the documented flag forms straight from sys.argv;
+    # anything else (help, typos, exotic forms) takes the full parser for
+    # argparse's usage and error reporting.
+    if command in _CLI_SPECS:
+        args = _fast_parse(command, sys.argv[2:])
+        if args is not None:
+            return int(_CLI_SPECS[command][0](args))
+    parser = build_parser(command)
     args = parser.parse_args()
-    return int(args.func(args))
+    # Direct dispatch through the spec table; no func attribute indirection.
+    return int(_CLI_SPECS[args.command][0](args))
 
 
 if __name__ == "__main__":
-    raise SystemExit(main())
+    rc = main()
+    if sys.flags.inspect:
+        raise SystemExit(rc)
+    # Plain CLI run: all writes are done, so flush and skip the interpreter
+    # teardown (gc, atexit, module finalization) that SystemExit would pay.
+    sys.stdout.flush()
+    sys.stderr.flush()
+    os._exit(rc)